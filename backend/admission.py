@@ -0,0 +1,175 @@
+from fastapi import HTTPException
+from backend.database import DB_POOL_SIZE, DB_MAX_OVERFLOW
+from dotenv import load_dotenv
+from typing import Dict, NamedTuple, Optional
+import asyncio
+import itertools
+import os
+
+load_dotenv()
+
+# Requests admitted at once across all routes. Defaults to the connection pool
+# capacity so admitted requests never wait on the pool itself.
+ADMISSION_CAPACITY = int(
+    os.environ.get("ADMISSION_CAPACITY", DB_POOL_SIZE + DB_MAX_OVERFLOW)
+)
+# Longest a queued request waits for a slot before it is shed.
+ADMISSION_QUEUE_TIMEOUT = float(os.environ.get("ADMISSION_QUEUE_TIMEOUT", "2"))
+ADMISSION_RETRY_AFTER = os.environ.get("ADMISSION_RETRY_AFTER", "1")
+
+
+class RouteLimit(NamedTuple):
+    """Admission settings for a route. Lower priority values are served first."""
+
+    priority: int
+    max_concurrency: Optional[int]  # None means up to the global capacity
+    max_queue: int
+
+
+ROUTE_LIMITS = {
+    "guess": RouteLimit(priority=0, max_concurrency=None, max_queue=100),
+    "elo": RouteLimit(priority=1, max_concurrency=None, max_queue=100),
+    "times": RouteLimit(priority=1, max_concurrency=None, max_queue=50),
+    "random": RouteLimit(priority=2, max_concurrency=5, max_queue=20),
+    "export": RouteLimit(priority=3, max_concurrency=1, max_queue=0),
+}
+
+
+class AdmissionRejected(Exception):
+    """Raised when a request cannot be admitted in time."""
+
+
+class RouteState:
+    def __init__(self, limit: RouteLimit, capacity: int):
+        self.limit = limit
+        self.max_concurrency = min(limit.max_concurrency or capacity, capacity)
+        self.active = 0
+        self.queued = 0
+        self.max_queued = 0
+        self.admitted = 0
+        self.rejected = 0
+        self.timed_out = 0
+
+
+class AdmissionController:
+    """
+    Bounds the number of in-flight requests overall and per route.
+    Requests that cannot run immediately wait in a bounded queue; freed slots
+    go to the waiting request with the best priority, then the oldest.
+    Requests are rejected when their route's queue is full or their wait
+    exceeds queue_timeout.
+    """
+
+    def __init__(self, capacity: int, routes: Dict[str, RouteLimit], queue_timeout: float):
+        self.capacity = capacity
+        self.queue_timeout = queue_timeout
+        self.in_use = 0
+        self.routes = {
+            name: RouteState(limit, capacity) for name, limit in routes.items()
+        }
+        self._waiters = []  # (priority, sequence, future, route state)
+        self._sequence = itertools.count()
+
+    def _can_run(self, state: RouteState) -> bool:
+        return self.in_use < self.capacity and state.active < state.max_concurrency
+
+    def _grant(self, state: RouteState):
+        self.in_use += 1
+        state.active += 1
+        state.admitted += 1
+
+    def _wake(self):
+        for waiter in sorted(self._waiters, key=lambda waiter: waiter[:2]):
+            if self.in_use >= self.capacity:
+                break
+            _, _, future, state = waiter
+            if state.active < state.max_concurrency:
+                self._waiters.remove(waiter)
+                state.queued -= 1
+                self._grant(state)
+                future.set_result(None)
+
+    async def acquire(self, route: str):
+        state = self.routes[route]
+        if self._can_run(state):
+            self._grant(state)
+            return
+
+        if state.queued >= state.limit.max_queue:
+            state.rejected += 1
+            raise AdmissionRejected(f"Queue for {route} is full")
+
+        future = asyncio.get_running_loop().create_future()
+        waiter = (state.limit.priority, next(self._sequence), future, state)
+        self._waiters.append(waiter)
+        state.queued += 1
+        state.max_queued = max(state.max_queued, state.queued)
+
+        try:
+            await asyncio.wait_for(asyncio.shield(future), self.queue_timeout)
+        except BaseException as e:
+            if waiter in self._waiters:
+                self._waiters.remove(waiter)
+                state.queued -= 1
+            else:
+                # The slot was granted just as the wait ended; hand it back.
+                self.release(route)
+            if isinstance(e, asyncio.TimeoutError):
+                state.timed_out += 1
+                raise AdmissionRejected(f"Timed out waiting for {route}") from e
+            raise
+
+    def release(self, route: str):
+        state = self.routes[route]
+        self.in_use -= 1
+        state.active -= 1
+        self._wake()
+
+    def snapshot(self) -> dict:
+        return {
+            "capacity": self.capacity,
+            "in_use": self.in_use,
+            "queue_depth": len(self._waiters),
+            "routes": {
+                name: {
+                    "active": state.active,
+                    "max_concurrency": state.max_concurrency,
+                    "queued": state.queued,
+                    "max_queued": state.max_queued,
+                    "max_queue": state.limit.max_queue,
+                    "admitted": state.admitted,
+                    "rejected": state.rejected,
+                    "timed_out": state.timed_out,
+                }
+                for name, state in self.routes.items()
+            },
+        }
+
+
+admission = AdmissionController(
+    ADMISSION_CAPACITY, ROUTE_LIMITS, ADMISSION_QUEUE_TIMEOUT
+)
+
+
+def overloaded() -> HTTPException:
+    return HTTPException(
+        status_code=503,
+        detail="Server is busy, please retry",
+        headers={"Retry-After": ADMISSION_RETRY_AFTER},
+    )
+
+
+def admit(route: str):
+    """Dependency factory that holds an admission slot for the request."""
+
+    async def dependency():
+        try:
+            await admission.acquire(route)
+        except AdmissionRejected:
+            raise overloaded()
+        try:
+            yield
+        finally:
+            admission.release(route)
+
+    return dependency
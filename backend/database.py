@@ -1,7 +1,11 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import sessionmaker, declarative_base
 from dotenv import load_dotenv
+import itertools
 import os
+import threading
+import time
 
 load_dotenv()
 
@@ -11,13 +15,204 @@ DB_USER = os.environ.get("DB_USER")
 DB_PASSWORD = os.environ.get("DB_PASSWORD")
 DB_PORT = os.environ.get("DB_PORT", "5432")
 
-DATABASE_URL = f"postgresql://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
+# Connection pool sizing, applied to the primary and to each replica. Requests
+# are admitted against this capacity (see backend/admission.py), so pool_timeout
+# is only a backstop and is kept short.
+DB_POOL_SIZE = int(os.environ.get("DB_POOL_SIZE", "5"))
+DB_MAX_OVERFLOW = int(os.environ.get("DB_MAX_OVERFLOW", "10"))
+DB_POOL_TIMEOUT = float(os.environ.get("DB_POOL_TIMEOUT", "5"))
+POOL_SETTINGS = dict(
+    pool_size=DB_POOL_SIZE,
+    max_overflow=DB_MAX_OVERFLOW,
+    pool_timeout=DB_POOL_TIMEOUT,
+)
 
-engine = create_engine(DATABASE_URL)
+# Comma-separated read replicas, e.g. "replica1,replica2:5433". Left empty,
+# every query goes to the primary.
+DB_REPLICA_HOSTS = os.environ.get("DB_REPLICA_HOSTS", "")
+# Replicas lagging further behind the primary than this are skipped.
+DB_REPLICA_MAX_LAG = os.environ.get("DB_REPLICA_MAX_LAG")
+DB_REPLICA_CHECK_INTERVAL = float(os.environ.get("DB_REPLICA_CHECK_INTERVAL", "5"))
+
+
+def build_database_url(host, port):
+    return f"postgresql://{DB_USER}:{DB_PASSWORD}@{host}:{port}/{DB_NAME}"
+
+
+DATABASE_URL = build_database_url(DB_HOST, DB_PORT)
+
+engine = create_engine(DATABASE_URL, **POOL_SETTINGS)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 Base = declarative_base()
 
+# Replication state used for the lag bound. A replica that has replayed all
+# the WAL it received is only caught up if its WAL receiver is still
+# streaming from the primary; a disconnected replica also stops with receive
+# and replay positions equal, however stale it is. Reading the receiver status
+# needs the pg_read_all_stats (or pg_monitor) role; without it the status
+# reads as NULL and the replica is judged by the age of its last replay.
+REPLICA_STATUS_QUERY = text(
+    """
+    SELECT
+        pg_is_in_recovery(),
+        EXISTS (SELECT 1 FROM pg_stat_wal_receiver WHERE status = 'streaming'),
+        pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn(),
+        EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp())
+    """
+)
+
+
+class ReplicaPool:
+    """
+    Round-robins read-only sessions across healthy replicas.
+    Health is refreshed every check_interval seconds by a background thread
+    (see start_health_checks), and while it runs requests only read the cached
+    state. When no replica is usable, the primary engine is returned instead.
+    """
+
+    def __init__(self, primary, replicas, max_lag=None, check_interval=5.0):
+        self.primary = primary
+        self.replicas = replicas
+        self.max_lag = max_lag
+        self.check_interval = check_interval
+        self._health = {}  # replica -> (is_healthy, checked_at)
+        self._checking = set()  # replicas with a probe in flight
+        self._cycle = itertools.cycle(replicas)
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._checker = None
+
+    def check_replica(self, replica):
+        """Returns True if the replica answers and is within the lag bound."""
+        try:
+            with replica.connect() as conn:
+                in_recovery, streaming, caught_up, replay_age = conn.execute(
+                    REPLICA_STATUS_QUERY
+                ).one()
+        except SQLAlchemyError as e:
+            print(f"Replica {replica.url.host} is unavailable: {e}")
+            return False
+
+        if self.max_lag is None or not in_recovery:
+            # Without a bound any answering server will do, and a server that
+            # is not replicating (e.g. a second local instance) has no lag.
+            return True
+
+        lag = 0 if streaming and caught_up else replay_age
+        if lag is None or lag > self.max_lag:
+            print(
+                f"Replica {replica.url.host} is too far behind "
+                f"(lag: {lag}, streaming: {streaming})"
+            )
+            return False
+        return True
+
+    def refresh(self, replica):
+        """
+        Re-checks a replica unless another caller is already doing so, in
+        which case the cached state is returned without waiting.
+        """
+        with self._lock:
+            if replica in self._checking:
+                return self._health.get(replica, (False, None))[0]
+            self._checking.add(replica)
+        try:
+            healthy = self.check_replica(replica)
+            self._health[replica] = (healthy, time.monotonic())
+        finally:
+            with self._lock:
+                self._checking.discard(replica)
+        return healthy
+
+    def is_healthy(self, replica):
+        healthy, checked_at = self._health.get(replica, (False, None))
+        if self._checker is not None:
+            # The background checker owns probing; never stall a request on it.
+            return healthy
+        if checked_at is None or time.monotonic() - checked_at >= self.check_interval:
+            # Only reached when the background checker is not running, e.g.
+            # from the CLI.
+            healthy = self.refresh(replica)
+        return healthy
+
+    def refresh_all(self):
+        """Probes every replica concurrently, so dead ones do not delay the rest."""
+        probes = [
+            threading.Thread(target=self.refresh, args=(replica,), daemon=True)
+            for replica in self.replicas
+        ]
+        for probe in probes:
+            probe.start()
+        for probe in probes:
+            probe.join()
+
+    def _run_health_checks(self):
+        while not self._stop.is_set():
+            self.refresh_all()
+            self._stop.wait(self.check_interval)
+
+    def start_health_checks(self):
+        """Starts refreshing replica health in a background thread."""
+        if not self.replicas or self._checker is not None:
+            return
+        self._stop.clear()
+        self._checker = threading.Thread(
+            target=self._run_health_checks, name="replica-health", daemon=True
+        )
+        self._checker.start()
+
+    def stop_health_checks(self):
+        if self._checker is None:
+            return
+        self._stop.set()
+        self._checker.join()
+        self._checker = None
+
+    def get_engine(self):
+        """Returns the next healthy replica, falling back to the primary."""
+        for _ in range(len(self.replicas)):
+            with self._lock:
+                replica = next(self._cycle)
+            if self.is_healthy(replica):
+                return replica
+        return self.primary
+
+
+def parse_replica_hosts(replica_hosts):
+    """Parses "host[:port],..." into (host, port) pairs."""
+    hosts = []
+    for entry in replica_hosts.split(","):
+        entry = entry.strip()
+        if not entry:
+            continue
+        host, _, port = entry.partition(":")
+        hosts.append((host, port or DB_PORT))
+    return hosts
+
+
+replica_engines = [
+    create_engine(
+        build_database_url(host, port),
+        pool_pre_ping=True,
+        # Keep a dead replica from stalling the request that health-checks it.
+        connect_args={"connect_timeout": 2},
+        **POOL_SETTINGS,
+    )
+    for host, port in parse_replica_hosts(DB_REPLICA_HOSTS)
+]
+replica_pool = ReplicaPool(
+    engine,
+    replica_engines,
+    max_lag=float(DB_REPLICA_MAX_LAG) if DB_REPLICA_MAX_LAG else None,
+    check_interval=DB_REPLICA_CHECK_INTERVAL,
+)
+
+
+def create_read_session():
+    """Creates a session bound to a replica, for read-only work."""
+    return SessionLocal(bind=replica_pool.get_engine())
+
 
 def get_db():
     """Dependency for getting a database session."""
@@ -28,5 +223,14 @@ def get_db():
         db.close()
 
 
+def get_read_db():
+    """Dependency for getting a read-only database session on a replica."""
+    db = create_read_session()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
 def create_tables():
     Base.metadata.create_all(bind=engine)
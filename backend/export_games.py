@@ -0,0 +1,64 @@
+import argparse
+import sys
+import time
+from datetime import date
+from backend.database import create_read_session
+from backend.services.export_service import (
+    DEFAULT_CHUNK_SIZE,
+    ECO_RE,
+    EXPORT_FORMATS,
+    stream_export,
+)
+
+
+def eco_code(value):
+    if not ECO_RE.match(value):
+        raise argparse.ArgumentTypeError(f"invalid ECO code: {value}")
+    return value
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Stream the games corpus to a file (or stdout) as NDJSON or PGN."
+    )
+    parser.add_argument("--format", choices=EXPORT_FORMATS, default="ndjson")
+    parser.add_argument("--output", "-o", help="Output file (defaults to stdout)")
+    parser.add_argument("--min-elo", type=int)
+    parser.add_argument("--max-elo", type=int)
+    parser.add_argument("--start-date", type=date.fromisoformat, help="YYYY-MM-DD")
+    parser.add_argument("--end-date", type=date.fromisoformat, help="YYYY-MM-DD")
+    parser.add_argument("--eco", type=eco_code, help="ECO code or prefix, e.g. B or B90")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    return parser.parse_args(argv)
+
+
+def export_games(args, out):
+    db = create_read_session()
+    try:
+        for chunk in stream_export(
+            db,
+            export_format=args.format,
+            chunk_size=args.chunk_size,
+            min_elo=args.min_elo,
+            max_elo=args.max_elo,
+            start_date=args.start_date,
+            end_date=args.end_date,
+            eco=args.eco,
+        ):
+            out.write(chunk)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+
+    start_time = time.time()
+    if args.output:
+        with open(args.output, "w") as out:
+            export_games(args, out)
+    else:
+        export_games(args, sys.stdout)
+    end_time = time.time()
+
+    print(f"Total time taken: {end_time - start_time:.2f} seconds", file=sys.stderr)
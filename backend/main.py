@@ -1,7 +1,7 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from backend.database import Base, engine, get_db, create_tables
-from backend.routers import games
+from backend.database import Base, engine, get_db, create_tables, replica_pool
+from backend.routers import export, games, metrics
 from backend import models
 import os
 
@@ -25,6 +25,8 @@ app.add_middleware(
 
 # Include routers
 app.include_router(games.router)
+app.include_router(export.router)
+app.include_router(metrics.router)
 
 
 @app.get("/")
@@ -36,9 +38,11 @@ async def root():
 async def startup():
     """Connect to the database on startup."""
     print("Starting up...")
+    replica_pool.start_health_checks()
 
 
 @app.on_event("shutdown")
 async def shutdown():
     """Disconnect from the database on shutdown."""
     print("Shutting down...")
+    replica_pool.stop_health_checks()
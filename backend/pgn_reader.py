@@ -0,0 +1,165 @@
+"""
+Lightweight, single-pass PGN reader.
+
+Unlike chess.pgn.read_game, this never builds a game tree or replays moves on
+a board: headers are split off line by line and the movetext is tokenized
+once to collect the mainline SAN moves and the [%clk] value after each ply.
+Moves are returned as written in the source PGN (apart from castling written
+with zeros, which is normalized), so they are not checked for legality.
+"""
+
+import io
+import re
+from typing import Iterator, List, Optional, Tuple
+
+HEADER_RE = re.compile(r'^\[([A-Za-z0-9][A-Za-z0-9_+#=:-]*)\s+"([^\r]*)"\]\s*$')
+CLOCK_RE = re.compile(r"\[%clk (\d+(:\d+){1,2})\]")
+MOVETEXT_RE = re.compile(
+    r"""
+    (?P<comment>\{[^}]*\})
+    | (?P<line_comment>;[^\n]*)
+    | (?P<open>\()
+    | (?P<close>\))
+    | (?P<nag>\$\d+)
+    | (?P<result>1-0|0-1|1/2-1/2|\*)
+    | (?P<move_number>\d+\.+)
+    | (?P<san>[^\s{}();$]+)
+    """,
+    re.VERBOSE,
+)
+
+
+def parse_time_control(time_control: Optional[str]) -> Optional[Tuple[int, int]]:
+    """Parses a "base+increment" TimeControl header into seconds."""
+    if not time_control or time_control == "-":
+        return None
+    try:
+        initial_time, increment = map(int, time_control.split("+"))
+    except ValueError:
+        return None
+    return initial_time, increment
+
+
+def parse_movetext(movetext: str) -> Tuple[List[str], List[Optional[str]]]:
+    """
+    Returns the mainline SAN moves and, for each ply, the [%clk] value from
+    the comment that follows it (None when there is none). Variations are
+    skipped.
+    """
+    moves = []
+    clocks = []
+    depth = 0
+    for token in MOVETEXT_RE.finditer(movetext):
+        kind = token.lastgroup
+        if kind == "open":
+            depth += 1
+        elif kind == "close":
+            depth -= 1
+        elif depth:
+            continue
+        elif kind == "san":
+            san = token.group().rstrip("!?")
+            if san.startswith("0-0"):
+                san = san.replace("0", "O")
+            moves.append(san)
+            clocks.append(None)
+        elif kind == "comment" and moves:
+            clock_match = CLOCK_RE.search(token.group())
+            if clock_match:
+                clocks[-1] = clock_match.group(1)
+    return moves, clocks
+
+
+class PgnGame:
+    """A game as read from a PGN stream. Movetext is tokenized on first use."""
+
+    __slots__ = ("headers", "movetext", "_moves", "_clocks")
+
+    def __init__(self, headers: dict, movetext: str):
+        self.headers = headers
+        self.movetext = movetext
+        self._moves = None
+        self._clocks = None
+
+    def _parse(self):
+        if self._moves is None:
+            self._moves, self._clocks = parse_movetext(self.movetext)
+
+    @property
+    def moves(self) -> List[str]:
+        self._parse()
+        return self._moves
+
+    @property
+    def clocks(self) -> List[Optional[str]]:
+        self._parse()
+        return self._clocks
+
+    @property
+    def time_control(self) -> Optional[Tuple[int, int]]:
+        return parse_time_control(self.headers.get("TimeControl"))
+
+    @property
+    def pgn(self) -> str:
+        """The game as PGN text, with headers and movetext as read."""
+        header_lines = "".join(
+            f'[{name} "{value}"]\n' for name, value in self.headers.items()
+        )
+        return f"{header_lines}\n{self.movetext}\n"
+
+
+def ends_in_comment(line: str, in_comment: bool) -> bool:
+    """
+    Returns whether a {brace comment} is still open at the end of the line.
+    Braces after a ; rest-of-line comment are ignored, and brace comments do
+    not nest, matching the PGN standard.
+    """
+    position = 0
+    while True:
+        if in_comment:
+            end = line.find("}", position)
+            if end < 0:
+                return True
+            in_comment = False
+            position = end + 1
+        else:
+            start = line.find("{", position)
+            line_comment = line.find(";", position)
+            if start < 0 or 0 <= line_comment < start:
+                return False
+            in_comment = True
+            position = start + 1
+
+
+def read_games(handle) -> Iterator[PgnGame]:
+    """Yields the games in a PGN text stream one at a time."""
+    headers = {}
+    movetext_lines = []
+    in_comment = False
+
+    for line in handle:
+        if not in_comment:
+            if line.startswith("%"):
+                continue
+            stripped = line.strip()
+            if stripped.startswith("["):
+                if movetext_lines:
+                    yield PgnGame(headers, "".join(movetext_lines).strip())
+                    headers = {}
+                    movetext_lines = []
+                header_match = HEADER_RE.match(stripped)
+                if header_match:
+                    headers[header_match.group(1)] = header_match.group(2)
+                continue
+            if not stripped:
+                continue
+        movetext_lines.append(line)
+        in_comment = ends_in_comment(line, in_comment)
+
+    if headers or movetext_lines:
+        yield PgnGame(headers, "".join(movetext_lines).strip())
+
+
+def parse_game(pgn: str) -> Optional[PgnGame]:
+    """Parses a single game from a PGN string."""
+    return next(read_games(io.StringIO(pgn)), None)
@@ -0,0 +1,108 @@
+from typing import Optional
+from datetime import date
+from fastapi import APIRouter, Depends, Header, HTTPException
+from fastapi.responses import StreamingResponse
+from starlette.concurrency import iterate_in_threadpool, run_in_threadpool
+from backend.admission import AdmissionRejected, admission, overloaded
+from backend.database import create_read_session
+from backend.services.export_service import ECO_RE, EXPORT_FORMATS, stream_export
+from dotenv import load_dotenv
+import anyio
+import os
+import secrets
+
+load_dotenv()
+
+# Bulk exports reveal every game's Elo, so they are only served to callers
+# holding this token. Left unset, the export endpoint is disabled.
+EXPORT_API_TOKEN = os.environ.get("EXPORT_API_TOKEN")
+
+router = APIRouter(
+    prefix="/internal/export",
+    tags=["export"],
+)
+
+
+class ClosingStreamingResponse(StreamingResponse):
+    """
+    StreamingResponse that runs on_close exactly once when the response ends,
+    whether the body was fully sent, the client disconnected or sending failed.
+    Background tasks are skipped on a disconnect, so they cannot be used to
+    free resources held by the stream.
+    """
+
+    def __init__(self, content, on_close, **kwargs):
+        super().__init__(content, **kwargs)
+        self.on_close = on_close
+
+    async def __call__(self, scope, receive, send):
+        try:
+            await super().__call__(scope, receive, send)
+        finally:
+            with anyio.CancelScope(shield=True):
+                await self.body_iterator.aclose()
+                await self.on_close()
+
+
+def require_export_token(authorization: Optional[str] = Header(None)):
+    """Dependency that only lets requests with the export token through."""
+    if not EXPORT_API_TOKEN:
+        raise HTTPException(status_code=404, detail="Not Found")
+    expected = f"Bearer {EXPORT_API_TOKEN}"
+    if authorization is None or not secrets.compare_digest(authorization, expected):
+        raise HTTPException(status_code=401, detail="Invalid export token")
+
+
+@router.get("/games", dependencies=[Depends(require_export_token)])
+async def export_games_endpoint(
+    format: str = "ndjson",
+    min_elo: Optional[int] = None,
+    max_elo: Optional[int] = None,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    eco: Optional[str] = None,
+):
+    """Streams the game corpus as NDJSON or PGN, filtered by Elo, date and ECO."""
+    if format not in EXPORT_FORMATS:
+        raise HTTPException(status_code=400, detail="Invalid export format")
+    if eco and not ECO_RE.match(eco):
+        raise HTTPException(status_code=400, detail="Invalid ECO code")
+
+    # The slot has to be held until the stream ends, which is after this
+    # function returns, so it is managed here rather than through admit().
+    try:
+        await admission.acquire("export")
+    except AdmissionRejected:
+        raise overloaded()
+
+    def generate():
+        # The session must outlive the endpoint call, so it is owned by the
+        # generator rather than injected through get_read_db.
+        db = create_read_session()
+        try:
+            yield from stream_export(
+                db,
+                export_format=format,
+                min_elo=min_elo,
+                max_elo=max_elo,
+                start_date=start_date,
+                end_date=end_date,
+                eco=eco,
+            )
+        finally:
+            db.close()
+
+    rows = generate()
+
+    async def close_export():
+        admission.release("export")
+        # Runs generate()'s finally, closing the session and its cursor
+        await run_in_threadpool(rows.close)
+
+    media_type = "application/x-ndjson" if format == "ndjson" else "application/x-chess-pgn"
+    return ClosingStreamingResponse(
+        iterate_in_threadpool(rows),
+        on_close=close_export,
+        media_type=media_type,
+        headers={"Content-Disposition": f"attachment; filename=games.{format}"},
+    )
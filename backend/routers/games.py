@@ -2,7 +2,8 @@ from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
 from backend import models, schemas
-from backend.database import get_db
+from backend.admission import admit
+from backend.database import get_read_db
 from backend.services.game_service import (
     get_initial_game_data,
     verify_elo_guess,
@@ -17,8 +18,12 @@ router = APIRouter(
 )
 
 
-@router.get("/random", response_model=schemas.InitialGameData)
-async def get_random_game_endpoint(db: Session = Depends(get_db)):
+@router.get(
+    "/random",
+    response_model=schemas.InitialGameData,
+    dependencies=[Depends(admit("random"))],
+)
+def get_random_game_endpoint(db: Session = Depends(get_read_db)):
     """Retrieves initial data for a random game."""
     initial_data = get_initial_game_data(db)
     if initial_data is None:
@@ -26,9 +31,13 @@ async def get_random_game_endpoint(db: Session = Depends(get_db)):
     return initial_data
 
 
-@router.post("/{game_uuid}/guess", response_model=schemas.Score)
-async def verify_guess_endpoint(
-    game_uuid: str, elo_guess: schemas.EloGuess, db: Session = Depends(get_db)
+@router.post(
+    "/{game_uuid}/guess",
+    response_model=schemas.Score,
+    dependencies=[Depends(admit("guess"))],
+)
+def verify_guess_endpoint(
+    game_uuid: str, elo_guess: schemas.EloGuess, db: Session = Depends(get_read_db)
 ):
     """Verifies the Elo guess and returns the score."""
     try:
@@ -43,8 +52,12 @@ async def verify_guess_endpoint(
     return {"score": score}
 
 
-@router.get("/{game_uuid}/elo", response_model=schemas.EloReveal)
-async def get_elo_endpoint(game_uuid: str, db: Session = Depends(get_db)):
+@router.get(
+    "/{game_uuid}/elo",
+    response_model=schemas.EloReveal,
+    dependencies=[Depends(admit("elo"))],
+)
+def get_elo_endpoint(game_uuid: str, db: Session = Depends(get_read_db)):
     """Retrieves the Elo ratings for a game after the guess is made."""
     try:
         game_id = uuid.UUID(game_uuid)
@@ -58,8 +71,12 @@ async def get_elo_endpoint(game_uuid: str, db: Session = Depends(get_db)):
     return elo_reveal
 
 
-@router.get("/{game_uuid}/times", response_model=List[schemas.MoveTime])
-async def get_move_times_endpoint(game_uuid: str, db: Session = Depends(get_db)):
+@router.get(
+    "/{game_uuid}/times",
+    response_model=List[schemas.MoveTime],
+    dependencies=[Depends(admit("times"))],
+)
+def get_move_times_endpoint(game_uuid: str, db: Session = Depends(get_read_db)):
     """Retrieves the move times for a specific game."""
     try:
         game_id = uuid.UUID(game_uuid)
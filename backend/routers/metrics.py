@@ -0,0 +1,14 @@
+from fastapi import APIRouter
+from backend import schemas
+from backend.admission import admission
+
+router = APIRouter(
+    prefix="/internal/metrics",
+    tags=["metrics"],
+)
+
+
+@router.get("/admission", response_model=schemas.AdmissionStats)
+async def get_admission_metrics_endpoint():
+    """Returns queue depth, in-flight and rejection counts per route."""
+    return admission.snapshot()
@@ -1,6 +1,6 @@
 from pydantic import BaseModel, validator
 from datetime import date
-from typing import List, Optional
+from typing import Dict, List, Optional
 import uuid 
 
 
@@ -128,3 +128,25 @@ class MoveTime(BaseModel):
     white_time: Optional[str] = None
     black_time: Optional[str] = None
     think_time: Optional[str] = None
+
+
+class RouteAdmissionStats(BaseModel):
+    """Model for admission control counters of a single route."""
+
+    active: int
+    max_concurrency: int
+    queued: int
+    max_queued: int
+    max_queue: int
+    admitted: int
+    rejected: int
+    timed_out: int
+
+
+class AdmissionStats(BaseModel):
+    """Model for admission control metrics."""
+
+    capacity: int
+    in_use: int
+    queue_depth: int
+    routes: Dict[str, RouteAdmissionStats]
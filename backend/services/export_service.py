@@ -0,0 +1,134 @@
+from sqlalchemy.orm import Session
+from backend import models
+from datetime import date
+from itertools import islice
+from typing import Iterator, List, Optional
+import json
+import re
+
+EXPORT_FORMATS = ("ndjson", "pgn")
+DEFAULT_CHUNK_SIZE = 1000
+# An ECO volume letter, optionally followed by one or two digits of the code
+ECO_RE = re.compile(r"^[A-E]\d{0,2}$")
+
+
+def build_export_query(
+    db: Session,
+    min_elo: Optional[int] = None,
+    max_elo: Optional[int] = None,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    eco: Optional[str] = None,
+):
+    """
+    Builds the games query for an export.
+    The Elo range applies to both players; the ECO filter matches by prefix,
+    so "B" selects a whole ECO volume and "B90" a single code.
+    """
+    query = db.query(models.Game)
+    if min_elo is not None:
+        query = query.filter(
+            models.Game.white_elo >= min_elo, models.Game.black_elo >= min_elo
+        )
+    if max_elo is not None:
+        query = query.filter(
+            models.Game.white_elo <= max_elo, models.Game.black_elo <= max_elo
+        )
+    if start_date is not None:
+        query = query.filter(models.Game.game_date >= start_date)
+    if end_date is not None:
+        query = query.filter(models.Game.game_date <= end_date)
+    if eco:
+        # Validated so the prefix cannot smuggle in LIKE wildcards
+        if not ECO_RE.match(eco):
+            raise ValueError(f"Invalid ECO code: {eco}")
+        query = query.filter(models.Game.eco.like(f"{eco}%"))
+    return query.order_by(models.Game.game_uuid)
+
+
+def iter_game_chunks(
+    db: Session, chunk_size: int = DEFAULT_CHUNK_SIZE, **filters
+) -> Iterator[List[models.Game]]:
+    """
+    Yields lists of at most chunk_size games.
+    yield_per makes psycopg2 use a server-side (named) cursor, so only one
+    chunk of rows is held in memory at a time.
+    """
+    rows = iter(build_export_query(db, **filters).yield_per(chunk_size))
+    while True:
+        chunk = list(islice(rows, chunk_size))
+        if not chunk:
+            break
+        yield chunk
+        # Drop the chunk's objects from the identity map so the session does
+        # not grow with the export.
+        db.expunge_all()
+
+
+def get_move_times_for_games(db: Session, game_uuids) -> dict:
+    """Retrieves the stored move times for a chunk of games, keyed by game UUID."""
+    move_times = {game_uuid: [] for game_uuid in game_uuids}
+    rows = (
+        db.query(models.GameMoveTime)
+        .filter(models.GameMoveTime.game_uuid.in_(game_uuids))
+        .order_by(models.GameMoveTime.game_uuid, models.GameMoveTime.move_number)
+    )
+    for row in rows:
+        move_times[row.game_uuid].append(
+            {
+                "move_number": row.move_number,
+                "white_time": (
+                    str(row.white_time) if row.white_time is not None else None
+                ),
+                "black_time": (
+                    str(row.black_time) if row.black_time is not None else None
+                ),
+            }
+        )
+    return move_times
+
+
+def game_to_dict(game: models.Game, move_times: list) -> dict:
+    """Converts a game row and its move times into a JSON-serializable dict."""
+    return {
+        "game_uuid": str(game.game_uuid),
+        "white_elo": game.white_elo,
+        "black_elo": game.black_elo,
+        "event": game.event,
+        "site": game.site,
+        "game_date": game.game_date.isoformat() if game.game_date else None,
+        "white_player": game.white_player,
+        "black_player": game.black_player,
+        "result": game.result,
+        "utc_date": game.utc_date,
+        "utc_time": game.utc_time,
+        "eco": game.eco,
+        "termination": game.termination,
+        "pgn": game.pgn,
+        "move_times": move_times,
+    }
+
+
+def stream_export(
+    db: Session,
+    export_format: str = "ndjson",
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    **filters,
+) -> Iterator[str]:
+    """
+    Streams the filtered game corpus as NDJSON lines or PGN text.
+    Yields one string per chunk so callers can write it out as they go.
+    """
+    if export_format not in EXPORT_FORMATS:
+        raise ValueError(f"Unsupported export format: {export_format}")
+
+    for chunk in iter_game_chunks(db, chunk_size, **filters):
+        if export_format == "pgn":
+            yield "".join(f"{game.pgn.strip()}\n\n" for game in chunk if game.pgn)
+            continue
+
+        move_times = get_move_times_for_games(db, [game.game_uuid for game in chunk])
+        yield "".join(
+            json.dumps(game_to_dict(game, move_times[game.game_uuid])) + "\n"
+            for game in chunk
+        )
@@ -1,11 +1,9 @@
 from sqlalchemy.orm import Session
 from backend import models, schemas
-import chess.pgn
-import io
+from backend.pgn_reader import parse_game
 from typing import List, Optional
 from sqlalchemy import func
 import uuid
-import re
 from datetime import datetime, timedelta
 
 
@@ -15,19 +13,16 @@ def get_initial_game_data(db: Session) -> schemas.InitialGameData:
     if game is None:
         return None
 
-    pgn_game = chess.pgn.read_game(io.StringIO(game.pgn))
-    total_moves = len(list(pgn_game.mainline_moves()))
+    pgn_game = parse_game(game.pgn)
+    total_moves = len(pgn_game.moves)
 
     # Extract move list in SAN format
     move_list = []
-    board = pgn_game.board()
-    for move_number, move in enumerate(pgn_game.mainline_moves()):
-        move_san = board.san(move)
+    for move_number, move_san in enumerate(pgn_game.moves):
         if move_number % 2 == 0:
             move_list.append(f"{(move_number // 2) + 1}. {move_san}")
         else:
             move_list.append(move_san)
-        board.push(move)
 
     return schemas.InitialGameData(
         game_uuid=str(game.game_uuid),
@@ -97,12 +92,11 @@ def get_move_times_by_game_uuid(
     if not game:
         return None
 
-    pgn_game = chess.pgn.read_game(io.StringIO(game.pgn))  # Parse PGN into chess.pgn.Game
-    headers = pgn_game.headers
-    time_control = headers.get("TimeControl")
+    pgn_game = parse_game(game.pgn)
+    time_control = pgn_game.time_control
 
-    if time_control and time_control != "-":
-        initial_time, increment = map(int, time_control.split("+"))
+    if time_control:
+        initial_time, increment = time_control
     else:
         initial_time, increment = 300, 0  # Default to 5 minutes with no increment if not specified
 
@@ -110,22 +104,13 @@ def get_move_times_by_game_uuid(
     black_time_remaining = timedelta(seconds=initial_time)
 
     move_times = []
-    node = pgn_game  # Start with the chess.pgn.Game object
     move_number = 0
     prev_white_time = None
     prev_black_time = None
 
-    while True:
-        next_node = node.variations[0] if node.variations else None  # Access variations correctly
-        if next_node is None:
-            break
-
-        # ... (Rest of your logic remains the same)
-        comment = next_node.comment
-        time_match = re.search(r"\[%clk (\d+(:\d+){1,2})\]", comment)
-        if time_match:
+    for time_str in pgn_game.clocks:
+        if time_str:
             move_number += 1
-            time_str = time_match.group(1)
             move_time = format_time(time_str)
 
             if move_number % 2 == 1:  # White's move
@@ -169,6 +154,4 @@ def get_move_times_by_game_uuid(
                 white_time_remaining += timedelta(seconds=increment)
                 black_time_remaining += timedelta(seconds=increment)
 
-        node = next_node
-
     return move_times
@@ -0,0 +1,292 @@
+from fastapi import FastAPI
+from backend import admission as admission_module
+from backend.admission import AdmissionController, AdmissionRejected, RouteLimit
+from backend.database import get_read_db
+from backend.routers import export, games, metrics
+import asyncio
+import httpx
+import pytest
+import time
+
+GAME_URL = "/games/00000000-0000-0000-0000-000000000000"
+
+
+def make_controller(capacity=1, queue_timeout=1.0, **routes):
+    routes = routes or {"r": RouteLimit(priority=0, max_concurrency=None, max_queue=5)}
+    return AdmissionController(capacity, routes, queue_timeout)
+
+
+async def settle():
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+def test_rejects_when_queue_is_full():
+    async def scenario():
+        controller = make_controller(
+            r=RouteLimit(priority=0, max_concurrency=None, max_queue=1)
+        )
+        await controller.acquire("r")
+        waiter = asyncio.create_task(controller.acquire("r"))
+        await settle()
+
+        with pytest.raises(AdmissionRejected):
+            await controller.acquire("r")
+        assert controller.routes["r"].rejected == 1
+
+        controller.release("r")
+        await waiter
+        controller.release("r")
+        assert controller.in_use == 0
+
+    asyncio.run(scenario())
+
+
+def test_rejects_after_queue_timeout():
+    async def scenario():
+        controller = make_controller(queue_timeout=0.05)
+        await controller.acquire("r")
+        start = time.monotonic()
+        with pytest.raises(AdmissionRejected):
+            await controller.acquire("r")
+        assert time.monotonic() - start < 0.5
+        state = controller.routes["r"]
+        assert (state.timed_out, state.queued, controller.in_use) == (1, 0, 1)
+
+    asyncio.run(scenario())
+
+
+def test_lower_priority_value_is_served_first():
+    async def scenario():
+        controller = make_controller(
+            cheap=RouteLimit(priority=0, max_concurrency=None, max_queue=5),
+            expensive=RouteLimit(priority=2, max_concurrency=None, max_queue=5),
+        )
+        order = []
+
+        async def request(route):
+            await controller.acquire(route)
+            order.append(route)
+            controller.release(route)
+
+        await controller.acquire("expensive")
+        # The expensive request queues first but the cheap one must win.
+        waiters = [asyncio.create_task(request("expensive"))]
+        await settle()
+        waiters.append(asyncio.create_task(request("cheap")))
+        await settle()
+
+        controller.release("expensive")
+        await asyncio.gather(*waiters)
+        assert order == ["cheap", "expensive"]
+
+    asyncio.run(scenario())
+
+
+def test_slot_handed_back_when_grant_races_timeout(monkeypatch):
+    async def scenario():
+        controller = make_controller()
+        await controller.acquire("r")
+
+        async def grant_then_time_out(awaitable, timeout):
+            # The slot is granted, but the wait ends with a timeout anyway.
+            controller.release("r")
+            awaitable.cancel()
+            raise asyncio.TimeoutError
+
+        monkeypatch.setattr(admission_module.asyncio, "wait_for", grant_then_time_out)
+        with pytest.raises(AdmissionRejected):
+            await controller.acquire("r")
+        monkeypatch.undo()
+
+        assert controller.in_use == 0
+        assert controller.routes["r"].active == 0
+        await controller.acquire("r")
+
+    asyncio.run(scenario())
+
+
+def test_cancelled_waiter_releases_queue_slot():
+    async def scenario():
+        controller = make_controller(
+            r=RouteLimit(priority=0, max_concurrency=None, max_queue=1)
+        )
+        await controller.acquire("r")
+        waiter = asyncio.create_task(controller.acquire("r"))
+        await settle()
+        assert controller.routes["r"].queued == 1
+
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        assert controller.routes["r"].queued == 0
+
+        # The freed queue slot can be used again.
+        waiter = asyncio.create_task(controller.acquire("r"))
+        await settle()
+        controller.release("r")
+        await waiter
+        assert controller.in_use == 1
+
+    asyncio.run(scenario())
+
+
+def test_cancelled_waiter_hands_back_granted_slot():
+    async def scenario():
+        controller = make_controller()
+        await controller.acquire("r")
+        waiter = asyncio.create_task(controller.acquire("r"))
+        await settle()
+
+        waiter.cancel()
+        controller.release("r")  # grants the slot to the cancelled waiter
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        assert controller.in_use == 0
+
+    asyncio.run(scenario())
+
+
+@pytest.fixture
+def app(monkeypatch):
+    app = FastAPI()
+    app.include_router(games.router)
+    app.include_router(export.router)
+    app.dependency_overrides[get_read_db] = lambda: None
+    return app
+
+
+def use_controller(monkeypatch, controller):
+    monkeypatch.setattr(admission_module, "admission", controller)
+    monkeypatch.setattr(export, "admission", controller)
+
+
+def test_overloaded_route_returns_503_with_retry_after(app, monkeypatch):
+    controller = make_controller(
+        random=RouteLimit(priority=2, max_concurrency=None, max_queue=0)
+    )
+    controller.in_use = controller.capacity
+    use_controller(monkeypatch, controller)
+
+    async def scenario():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            return await client.get("/games/random")
+
+    response = asyncio.run(scenario())
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == admission_module.ADMISSION_RETRY_AFTER
+    assert controller.routes["random"].rejected == 1
+
+
+def test_guess_is_served_while_random_games_are_saturated(app, monkeypatch):
+    controller = AdmissionController(
+        15, admission_module.ROUTE_LIMITS, queue_timeout=2.0
+    )
+    use_controller(monkeypatch, controller)
+
+    def slow_random_game(db):
+        time.sleep(0.3)  # blocking, like a real query
+        return None
+
+    monkeypatch.setattr(games, "get_initial_game_data", slow_random_game)
+    monkeypatch.setattr(games, "verify_elo_guess", lambda db, game_id, guess: 900)
+
+    async def scenario():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            start = time.monotonic()
+            randoms = [
+                asyncio.create_task(client.get("/games/random")) for _ in range(8)
+            ]
+            await asyncio.sleep(0.05)
+            guess = await client.post(
+                f"{GAME_URL}/guess", json={"white_guess": 1500, "black_guess": 1500}
+            )
+            guess_time = time.monotonic() - start
+            await asyncio.gather(*randoms)
+            return guess, guess_time
+
+    guess, guess_time = asyncio.run(scenario())
+    assert guess.json() == {"score": 900}
+    # Five random games hold their slots for 0.3s and three more are queued;
+    # the guess, sent 50ms in, must not wait behind them.
+    assert guess_time < 0.25
+    assert controller.routes["random"].max_queued == 3
+
+
+def test_export_slot_and_session_released_on_disconnect(app, monkeypatch):
+    controller = make_controller(
+        capacity=2, export=RouteLimit(priority=3, max_concurrency=1, max_queue=0)
+    )
+    use_controller(monkeypatch, controller)
+    monkeypatch.setattr(export, "EXPORT_API_TOKEN", "secret")
+
+    closed = []
+
+    class FakeSession:
+        def close(self):
+            closed.append(True)
+
+    monkeypatch.setattr(export, "create_read_session", FakeSession)
+    monkeypatch.setattr(
+        export, "stream_export", lambda db, **filters: iter(["row\n"] * 1000)
+    )
+
+    async def scenario():
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0", "spec_version": "2.4"},
+            "http_version": "1.1",
+            "method": "GET",
+            "scheme": "http",
+            "path": "/internal/export/games",
+            "raw_path": b"/internal/export/games",
+            "query_string": b"",
+            "root_path": "",
+            "headers": [(b"authorization", b"Bearer secret")],
+            "client": ("test", 1),
+            "server": ("test", 80),
+        }
+        sent = []
+
+        async def receive():
+            return {"type": "http.request", "body": b"", "more_body": False}
+
+        async def send(message):
+            # The client goes away after the first chunk of the body.
+            if message["type"] == "http.response.body" and sent:
+                raise OSError("client disconnected")
+            if message["type"] == "http.response.body":
+                sent.append(message)
+
+        with pytest.raises(Exception):
+            await app(scope, receive, send)
+
+        # Checked before yielding to the loop, so cleanup cannot come from
+        # garbage collection of the abandoned stream.
+        assert controller.routes["export"].active == 0
+        assert controller.in_use == 0
+        assert closed == [True]
+
+    asyncio.run(scenario())
+
+
+def test_metrics_are_internal(monkeypatch):
+    controller = make_controller()
+    use_controller(monkeypatch, controller)
+    monkeypatch.setattr(metrics, "admission", controller)
+    app = FastAPI()
+    app.include_router(metrics.router)
+
+    async def scenario():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            return (
+                await client.get("/metrics/admission"),
+                await client.get("/internal/metrics/admission"),
+            )
+
+    public, internal = asyncio.run(scenario())
+    assert public.status_code == 404
+    assert internal.json()["capacity"] == controller.capacity
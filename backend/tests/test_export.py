@@ -0,0 +1,118 @@
+from datetime import date, timedelta
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+from backend import models
+from backend.routers import export
+from backend.services.export_service import build_export_query, stream_export
+import json
+import pytest
+import uuid
+
+
+@pytest.fixture
+def db():
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    models.Base.metadata.create_all(bind=engine)
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+
+
+def add_game(db, white_elo, black_elo, eco, move_times=()):
+    game = models.Game(
+        game_uuid=uuid.uuid4(),
+        pgn='[Event "Test"]\n\n1. e4 e5 *\n',
+        white_elo=white_elo,
+        black_elo=black_elo,
+        game_date=date(2024, 1, 1),
+        eco=eco,
+    )
+    db.add(game)
+    for move_number, white_time, black_time in move_times:
+        db.add(
+            models.GameMoveTime(
+                game_uuid=game.game_uuid,
+                move_number=move_number,
+                white_time=white_time,
+                black_time=black_time,
+            )
+        )
+    db.commit()
+    return game
+
+
+def test_ndjson_export_filters_and_keeps_zero_clocks(db):
+    add_game(
+        db,
+        1500,
+        1550,
+        "B90",
+        move_times=[(1, timedelta(seconds=3), None), (2, None, timedelta(0))],
+    )
+    add_game(db, 1500, 2100, "B90")
+    add_game(db, 1500, 1550, "C20")
+
+    lines = "".join(
+        stream_export(db, min_elo=1400, max_elo=1600, eco="B9", chunk_size=1)
+    ).splitlines()
+
+    assert len(lines) == 1
+    exported = json.loads(lines[0])
+    assert exported["eco"] == "B90"
+    assert exported["move_times"] == [
+        {"move_number": 1, "white_time": "0:00:03", "black_time": None},
+        {"move_number": 2, "white_time": None, "black_time": "0:00:00"},
+    ]
+
+
+def test_pgn_export(db):
+    add_game(db, 1500, 1550, "B90")
+    assert "".join(stream_export(db, export_format="pgn")) == (
+        '[Event "Test"]\n\n1. e4 e5 *\n\n'
+    )
+
+
+@pytest.mark.parametrize("eco", ["%", "B_0", "B%", "F10", "B100"])
+def test_invalid_eco_is_rejected(db, eco):
+    with pytest.raises(ValueError):
+        build_export_query(db, eco=eco)
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setattr(export, "EXPORT_API_TOKEN", "secret")
+    app = FastAPI()
+    app.include_router(export.router)
+    return TestClient(app)
+
+
+def test_export_requires_token(client):
+    assert client.get("/internal/export/games").status_code == 401
+    response = client.get(
+        "/internal/export/games", headers={"Authorization": "Bearer wrong"}
+    )
+    assert response.status_code == 401
+
+
+def test_export_disabled_without_token(client, monkeypatch):
+    monkeypatch.setattr(export, "EXPORT_API_TOKEN", None)
+    response = client.get(
+        "/internal/export/games", headers={"Authorization": "Bearer secret"}
+    )
+    assert response.status_code == 404
+
+
+def test_export_rejects_invalid_eco(client):
+    response = client.get(
+        "/internal/export/games",
+        params={"eco": "B%"},
+        headers={"Authorization": "Bearer secret"},
+    )
+    assert response.status_code == 400
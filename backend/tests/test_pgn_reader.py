@@ -0,0 +1,121 @@
+from backend.pgn_reader import parse_game, parse_movetext, read_games
+import io
+import pytest
+
+
+def test_headers_moves_and_clocks():
+    game = parse_game(
+        '[Event "Rated Blitz game"]\n'
+        '[TimeControl "180+2"]\n'
+        "\n"
+        "1. e4 { [%eval 0.2] [%clk 0:03:00] } 1... e5 { [%clk 0:02:58] } "
+        "2. Nf3 { no clock } 2... Nc6 { [%clk 0:02:55] } 1-0\n"
+    )
+    assert game.headers == {"Event": "Rated Blitz game", "TimeControl": "180+2"}
+    assert game.moves == ["e4", "e5", "Nf3", "Nc6"]
+    assert game.clocks == ["0:03:00", "0:02:58", None, "0:02:55"]
+    assert game.time_control == (180, 2)
+
+
+def test_variations_are_skipped():
+    moves, clocks = parse_movetext(
+        "1. e4 { [%clk 0:01:00] } ( 1. d4 { [%clk 0:00:01] } ( 1. c4 ) d5 ) "
+        "1... e5 2. Nf3 *"
+    )
+    assert moves == ["e4", "e5", "Nf3"]
+    assert clocks == ["0:01:00", None, None]
+
+
+def test_nags_and_annotations_are_dropped():
+    moves, _ = parse_movetext("1. e4 $1 e5?! $6 2. Qh5!! Nc6 *")
+    assert moves == ["e4", "e5", "Qh5", "Nc6"]
+
+
+def test_move_numbers_without_spaces():
+    moves, _ = parse_movetext("1.e4 e5 2.Nf3 2...Nc6 3.Bb5 1/2-1/2")
+    assert moves == ["e4", "e5", "Nf3", "Nc6", "Bb5"]
+
+
+def test_castling_with_zeros_is_normalized():
+    moves, _ = parse_movetext("1. e4 e5 2. Nf3 Nc6 3. Bc4 Bc5 4. 0-0 0-0-0+ *")
+    assert moves[-2:] == ["O-O", "O-O-O+"]
+
+
+def test_multi_line_comment():
+    games = list(
+        read_games(
+            io.StringIO(
+                '[Event "1"]\n'
+                "\n"
+                "1. e4 { a comment\n"
+                '[Event "not a header"]\n'
+                "still the comment [%clk 0:00:10] } e5 *\n"
+            )
+        )
+    )
+    assert len(games) == 1
+    assert games[0].moves == ["e4", "e5"]
+    assert games[0].clocks == ["0:00:10", None]
+
+
+def test_line_comments():
+    games = list(
+        read_games(
+            io.StringIO(
+                '[Event "1"]\n\n1. e4 ; note {\ne5 *\n\n[Event "2"]\n\n1. d4 *\n'
+            )
+        )
+    )
+    assert [game.headers["Event"] for game in games] == ["1", "2"]
+    assert [game.moves for game in games] == [["e4", "e5"], ["d4"]]
+
+
+def test_multiple_games_in_one_stream():
+    games = list(
+        read_games(
+            io.StringIO(
+                '[Event "1"]\n[Site "a"]\n\n1. e4 e5 1-0\n\n'
+                '[Event "2"]\n[Site "b"]\n\n1. d4 d5\n2. c4 0-1\n\n'
+                '[Event "3"]\n\n*\n'
+            )
+        )
+    )
+    assert [game.headers["Event"] for game in games] == ["1", "2", "3"]
+    assert [game.moves for game in games] == [["e4", "e5"], ["d4", "d5", "c4"], []]
+    assert games[1].pgn == '[Event "2"]\n[Site "b"]\n\n1. d4 d5\n2. c4 0-1\n'
+
+
+def test_escape_lines_are_ignored():
+    games = list(
+        read_games(
+            io.StringIO('% exported by a tool\n[Event "1"]\n\n1. e4\n% note\ne5 *\n')
+        )
+    )
+    assert len(games) == 1
+    assert games[0].moves == ["e4", "e5"]
+
+
+@pytest.mark.parametrize("time_control", ["", "-", "180", "180+x", "blitz"])
+def test_missing_or_malformed_time_control(time_control):
+    game = parse_game(f'[TimeControl "{time_control}"]\n\n1. e4 *\n')
+    assert game.time_control is None
+
+
+def test_no_time_control_header():
+    assert parse_game('[Event "1"]\n\n1. e4 *\n').time_control is None
+
+
+def test_matches_python_chess():
+    chess_pgn = pytest.importorskip("chess.pgn")
+    pgn = (
+        '[Event "Test"]\n\n'
+        "1. e4 { [%clk 0:03:00] } e5 { [%clk 0:03:00] } 2. Nf3 $1 ( 2. f4 exf4 ) "
+        "Nc6 { [%clk 0:02:59] } 3. Bc4 Bc5 4. O-O Nf6 5. d3 d6 *\n"
+    )
+    game = chess_pgn.read_game(io.StringIO(pgn))
+    board = game.board()
+    expected = []
+    for move in game.mainline_moves():
+        expected.append(board.san(move))
+        board.push(move)
+    assert parse_game(pgn).moves == expected
@@ -0,0 +1,169 @@
+from backend.database import ReplicaPool
+from sqlalchemy.exc import OperationalError
+import pytest
+import threading
+import time
+
+
+class FakeReplicaPool(ReplicaPool):
+    """ReplicaPool whose health probes are scripted instead of hitting Postgres."""
+
+    def __init__(self, health, probe_time=0.0, **kwargs):
+        super().__init__("primary", list(health), **kwargs)
+        self.health = health
+        self.probe_time = probe_time
+        self.probes = []
+
+    def check_replica(self, replica):
+        self.probes.append((replica, threading.current_thread()))
+        probe_time = self.probe_time
+        if isinstance(probe_time, dict):
+            probe_time = probe_time[replica]
+        time.sleep(probe_time)
+        return self.health[replica]
+
+
+def test_round_robins_over_healthy_replicas():
+    pool = FakeReplicaPool({"r1": True, "r2": False, "r3": True})
+    assert [pool.get_engine() for _ in range(4)] == ["r1", "r3", "r1", "r3"]
+
+
+def test_falls_back_to_primary():
+    assert FakeReplicaPool({"r1": False}).get_engine() == "primary"
+    assert FakeReplicaPool({}).get_engine() == "primary"
+
+
+def test_health_is_cached_between_checks():
+    pool = FakeReplicaPool({"r1": True}, check_interval=60)
+    for _ in range(5):
+        pool.get_engine()
+    assert [replica for replica, _ in pool.probes] == ["r1"]
+
+
+def test_concurrent_callers_probe_a_stale_replica_once():
+    pool = FakeReplicaPool({"r1": False}, probe_time=0.2, check_interval=60)
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(pool.get_engine()))
+        for _ in range(8)
+    ]
+    start = time.monotonic()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert [replica for replica, _ in pool.probes] == ["r1"]
+    assert results == ["primary"] * 8
+    # Only the caller doing the probe waits for it; the total stays ~1 probe.
+    assert time.monotonic() - start < 0.4
+
+
+def test_background_checks_refresh_health():
+    pool = FakeReplicaPool({"r1": False}, check_interval=0.05)
+    pool.start_health_checks()
+    try:
+        time.sleep(0.02)
+        assert pool.get_engine() == "primary"
+        pool.health["r1"] = True
+        time.sleep(0.15)
+        assert pool.get_engine() == "r1"
+    finally:
+        pool.stop_health_checks()
+    assert len(pool.probes) >= 2
+
+
+def test_requests_never_probe_while_checker_runs():
+    pool = FakeReplicaPool(
+        {"r1": True, "r2": False, "r3": False},
+        probe_time={"r1": 0.0, "r2": 0.2, "r3": 0.2},
+        check_interval=0.1,
+    )
+    pool.start_health_checks()
+    try:
+        time.sleep(0.3)
+        slowest = 0.0
+        deadline = time.monotonic() + 1.0
+        while time.monotonic() < deadline:
+            start = time.monotonic()
+            assert pool.get_engine() == "r1"
+            slowest = max(slowest, time.monotonic() - start)
+            time.sleep(0.01)
+    finally:
+        pool.stop_health_checks()
+
+    main_thread = threading.current_thread()
+    assert all(thread is not main_thread for _, thread in pool.probes)
+    assert slowest < 0.05
+
+
+def test_background_checks_probe_replicas_concurrently():
+    pool = FakeReplicaPool(
+        {"r1": False, "r2": False, "r3": False}, probe_time=0.2
+    )
+    start = time.monotonic()
+    pool.refresh_all()
+    assert time.monotonic() - start < 0.4
+    assert sorted(replica for replica, _ in pool.probes) == ["r1", "r2", "r3"]
+
+
+class FakeResult:
+    def __init__(self, row):
+        self.row = row
+
+    def one(self):
+        return self.row
+
+
+class FakeConnection:
+    def __init__(self, row):
+        self.row = row
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def execute(self, query):
+        return FakeResult(self.row)
+
+
+class FakeEngine:
+    """Engine stand-in whose connection returns a scripted replication status."""
+
+    def __init__(self, row=None, error=None):
+        self.row = row
+        self.error = error
+        self.url = type("URL", (), {"host": "replica"})()
+
+    def connect(self):
+        if self.error:
+            raise self.error
+        return FakeConnection(self.row)
+
+
+@pytest.mark.parametrize(
+    "row, max_lag, healthy",
+    [
+        # (in_recovery, streaming, caught_up, replay_age)
+        ((True, True, True, 7200.0), 30, True),  # idle primary, still streaming
+        ((True, False, True, 7200.0), 30, False),  # receiver gone, hours stale
+        ((True, False, True, 5.0), 30, True),  # receiver gone, recently replayed
+        ((True, True, False, 60.0), 30, False),  # streaming but behind
+        ((True, True, False, 10.0), 30, True),
+        ((True, None, True, 7200.0), 30, False),  # status not readable
+        ((True, False, None, None), 30, False),  # nothing replayed yet
+        ((True, False, True, 7200.0), None, True),  # no bound configured
+        ((False, False, None, None), 30, True),  # not a replica at all
+    ],
+)
+def test_check_replica_lag_bound(row, max_lag, healthy):
+    pool = ReplicaPool("primary", [], max_lag=max_lag)
+    assert pool.check_replica(FakeEngine(row)) is healthy
+
+
+def test_check_replica_unreachable():
+    error = OperationalError("SELECT 1", {}, Exception("connection refused"))
+    pool = ReplicaPool("primary", [], max_lag=30)
+    assert pool.check_replica(FakeEngine(error=error)) is False
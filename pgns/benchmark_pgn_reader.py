@@ -0,0 +1,111 @@
+import chess.pgn
+import io
+import re
+import sys
+import time
+import os
+
+# Make the backend package importable when run as a script from any directory
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from backend.pgn_reader import read_games, parse_game
+
+
+def tree_loader_pass(pgn_file):
+    """The loader's previous approach: game tree, str(game), regex per comment."""
+    games = 0
+    with open(pgn_file, encoding="utf-8", errors="replace") as pgn:
+        while True:
+            game = chess.pgn.read_game(pgn)
+            if game is None:
+                break
+            str(game)
+            node = game
+            while node.variations:
+                node = node.variations[0]
+                re.search(r"\[%clk (\d+(:\d+){1,2})\]", node.comment)
+            games += 1
+    return games
+
+
+def reader_loader_pass(pgn_file):
+    games = 0
+    with open(pgn_file, encoding="utf-8", errors="replace") as pgn:
+        for game in read_games(pgn):
+            game.pgn
+            game.clocks
+            games += 1
+    return games
+
+
+def tree_service_pass(pgns):
+    """The service layer's previous approach: re-parse, replay SAN, walk clocks."""
+    for pgn in pgns:
+        game = chess.pgn.read_game(io.StringIO(pgn))
+        board = game.board()
+        for move in game.mainline_moves():
+            board.san(move)
+            board.push(move)
+        game = chess.pgn.read_game(io.StringIO(pgn))
+        node = game
+        while node.variations:
+            node = node.variations[0]
+            re.search(r"\[%clk (\d+(:\d+){1,2})\]", node.comment)
+    return len(pgns)
+
+
+def reader_service_pass(pgns):
+    for pgn in pgns:
+        parse_game(pgn).moves
+        parse_game(pgn).clocks
+    return len(pgns)
+
+
+def check_equivalence(pgns):
+    """Verifies the reader returns the same SAN moves and clocks as python-chess."""
+    for pgn in pgns:
+        game = chess.pgn.read_game(io.StringIO(pgn))
+        board = game.board()
+        expected_moves = []
+        expected_clocks = []
+        for node in game.mainline():
+            expected_moves.append(board.san(node.move))
+            board.push(node.move)
+            time_match = re.search(r"\[%clk (\d+(:\d+){1,2})\]", node.comment)
+            expected_clocks.append(time_match.group(1) if time_match else None)
+
+        parsed = parse_game(pgn)
+        if (
+            parsed.headers != dict(game.headers)
+            or parsed.moves != expected_moves
+            or parsed.clocks != expected_clocks
+        ):
+            raise AssertionError(f"Reader mismatch for game {parsed.headers.get('Site')}")
+
+
+def timed(label, func, *args):
+    start_time = time.perf_counter()
+    count = func(*args)
+    elapsed = time.perf_counter() - start_time
+    print(f"{label:<28} {count} games in {elapsed:.2f}s ({count / elapsed:,.0f} games/s)")
+    return elapsed
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("Usage: python benchmark_pgn_reader.py <filename>.pgn")
+        sys.exit(1)
+
+    pgn_file = sys.argv[1]
+    with open(pgn_file, encoding="utf-8", errors="replace") as pgn:
+        pgns = [game.pgn for game in read_games(pgn)]
+
+    check_equivalence(pgns)
+    print(f"Reader output matches python-chess for {len(pgns)} games.")
+
+    tree_time = timed("loader (chess.pgn tree)", tree_loader_pass, pgn_file)
+    reader_time = timed("loader (pgn_reader)", reader_loader_pass, pgn_file)
+    print(f"Loader speedup: {tree_time / reader_time:.1f}x")
+
+    tree_time = timed("service (chess.pgn tree)", tree_service_pass, pgns)
+    reader_time = timed("service (pgn_reader)", reader_service_pass, pgns)
+    print(f"Service speedup: {tree_time / reader_time:.1f}x")
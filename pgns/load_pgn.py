@@ -1,13 +1,15 @@
-import chess.pgn
 import psycopg2
 from psycopg2.extras import execute_values
 import uuid
 import sys
 import time
-import re
 from dotenv import load_dotenv
 import os
 
+# Make the backend package importable when run as a script from any directory
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from backend.pgn_reader import read_games
+
 load_dotenv()
 
 # Database connection details
@@ -57,7 +59,8 @@ def format_time(time_str):
 
 
 def load_games(pgn_file, db_connection):
-    pgn = open(pgn_file)
+    # Undecodable bytes are replaced rather than aborting the whole stream
+    pgn = open(pgn_file, encoding="utf-8", errors="replace")
 
     bucket_counts = {i: 0 for i in range(1, 9)}  # Initialize counts for each bucket
     target_count = 10000  # Target number of games per bucket
@@ -66,89 +69,71 @@ def load_games(pgn_file, db_connection):
     games_batch = []
     times_batch = []
 
-    while True:
-        try:
-            game = chess.pgn.read_game(pgn)
-            if game is None:
-                break  # End of file
-
-            headers = game.headers
-            white_elo = headers.get("WhiteElo")
-            black_elo = headers.get("BlackElo")
-
-            if white_elo is None or black_elo is None:
-              continue
-
-            try:
-                white_elo = int(white_elo)
-                black_elo = int(black_elo)
-            except ValueError:
-                print("Skipping a game with invalid elo.")
-                continue
-
-            avg_elo = (white_elo + black_elo) // 2
-            bucket = get_elo_bucket(avg_elo)
-            elo_diff = abs(white_elo - black_elo)
-
-            if bucket_counts[bucket] < target_count and elo_diff <= max_diff:
-                game_uuid = str(uuid.uuid4())
-                # Add game data to games_batch
-                games_batch.append(
-                    (
-                        game_uuid,
-                        str(game),
-                        white_elo,
-                        black_elo,
-                        headers.get("Event"),
-                        headers.get("Site"),
-                        headers.get("Date"),
-                        headers.get("White"),
-                        headers.get("Black"),
-                        headers.get("Result"),
-                        headers.get("UTCDate"),
-                        headers.get("UTCTime"),
-                        headers.get("ECO"),
-                        headers.get("Termination"),
-                    )
-                )
+    for game in read_games(pgn):
+        headers = game.headers
+        white_elo = headers.get("WhiteElo")
+        black_elo = headers.get("BlackElo")
+
+        if white_elo is None or black_elo is None:
+          continue
 
-                # Extract move times
-                node = game
-                move_number = 0
-                while True:
-                    next_node = node.variations[0] if node.variations else None
-                    if next_node is None:
-                        break
-
-                    comment = next_node.comment
-                    time_match = re.search(r"\[%clk (\d+(:\d+){1,2})\]", comment) # Regex for pattern
-                    if time_match:
-                        move_number += 1
-                        time_str = time_match.group(1)
-                        if move_number % 2 == 1:  # White's move
-                            white_time = format_time(time_str)
-                            black_time = None
-                        else:  # Black's move
-                            black_time = format_time(time_str)
-                            white_time = None
-
-                        if white_time or black_time:
-                            times_batch.append((game_uuid, move_number, white_time, black_time))
-                    node = next_node
-
-                if len(games_batch) >= batch_size:
-                    # Insert batches into the database
-                    insert_games(db_connection, games_batch)
-                    insert_move_times(db_connection, times_batch)
-                    bucket_counts[bucket] += len(games_batch)
-                    print(f"Inserted batch of {len(games_batch)} games and their move times into bucket {bucket}. Count: {bucket_counts[bucket]}")
-                    games_batch = [] # Clear the batches
-                    times_batch = []
-
-        except UnicodeDecodeError as e:
-            print(f"Skipping game due to UnicodeDecodeError: {e}")
+        try:
+            white_elo = int(white_elo)
+            black_elo = int(black_elo)
+        except ValueError:
+            print("Skipping a game with invalid elo.")
             continue
 
+        avg_elo = (white_elo + black_elo) // 2
+        bucket = get_elo_bucket(avg_elo)
+        elo_diff = abs(white_elo - black_elo)
+
+        if bucket_counts[bucket] < target_count and elo_diff <= max_diff:
+            game_uuid = str(uuid.uuid4())
+            # Add game data to games_batch
+            games_batch.append(
+                (
+                    game_uuid,
+                    game.pgn,
+                    white_elo,
+                    black_elo,
+                    headers.get("Event"),
+                    headers.get("Site"),
+                    headers.get("Date"),
+                    headers.get("White"),
+                    headers.get("Black"),
+                    headers.get("Result"),
+                    headers.get("UTCDate"),
+                    headers.get("UTCTime"),
+                    headers.get("ECO"),
+                    headers.get("Termination"),
+                )
+            )
+
+            # Extract move times (movetext is only tokenized for accepted games)
+            move_number = 0
+            for time_str in game.clocks:
+                if time_str:
+                    move_number += 1
+                    if move_number % 2 == 1:  # White's move
+                        white_time = format_time(time_str)
+                        black_time = None
+                    else:  # Black's move
+                        black_time = format_time(time_str)
+                        white_time = None
+
+                    if white_time or black_time:
+                        times_batch.append((game_uuid, move_number, white_time, black_time))
+
+            if len(games_batch) >= batch_size:
+                # Insert batches into the database
+                insert_games(db_connection, games_batch)
+                insert_move_times(db_connection, times_batch)
+                bucket_counts[bucket] += len(games_batch)
+                print(f"Inserted batch of {len(games_batch)} games and their move times into bucket {bucket}. Count: {bucket_counts[bucket]}")
+                games_batch = [] # Clear the batches
+                times_batch = []
+
     # Insert any remaining games and times in the last batch
     if games_batch:
         insert_games(db_connection, games_batch)